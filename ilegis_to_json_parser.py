@@ -1,77 +1,118 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-import argparse, json, re, logging
+import argparse, json, re, logging, os, multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from functools import partial
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
-from bs4 import BeautifulSoup
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
+from bs4 import BeautifulSoup, SoupStrainer
 
-from leg5_src.extractor.model import Entry, MetaInfo
+try:
+    import orjson  # optional: faster JSON output
+except ImportError:
+    orjson = None
+
+from leg5_src.extractor.model import Entry, MetaInfo, entry_json
 
 # ---------- minimal PHP print_r Array(...) parser ----------
-_KEY = re.compile(r"^\s*\[([^\]]+)\]\s*=>\s*(.*)$")
-OPEN = re.compile(r"^\s*\($")
-CLOSE = re.compile(r"^\s*\)\s*$")
-WORD_ARRAY = re.compile(r"^\s*Array\s*$")
+def _split_key(line: str):
+    """Split a `[key] => value` line into (key, value); None if it isn't one."""
+    s = line.lstrip()
+    if not s.startswith("["):
+        return None
+    end = s.find("]", 1)
+    if end <= 1:
+        return None
+    rest = s[end + 1:].lstrip()
+    if not rest.startswith("=>"):
+        return None
+    return s[1:end].strip(), rest[2:].strip()
 
 
 def parse_php_array(text: str):
-    """Tiny parser for common print_r arrays: Array ( [k] => v ... )"""
-    txt = text.replace("&gt;", ">").replace("&lt;", "<").replace("&amp;", "&")
+    """
+    Tiny parser for common print_r arrays: Array ( [k] => v ... )
+    Single pass over the lines with an explicit stack instead of recursion;
+    lines are classified with plain string checks rather than regexes.
+    """
+    txt = _norm_printr(text)
     lines = [l.rstrip() for l in txt.splitlines() if l.strip() != ""]
-    if not lines:
+    n = len(lines)
+    if not n:
         return {}
-    i = 0
-    if WORD_ARRAY.match(lines[0]):  # skip "Array"
-        i += 1
-        if i < len(lines) and OPEN.match(lines[i]):
-            i += 1
-
-    def parse_value(j):
-        if j < len(lines) and WORD_ARRAY.match(lines[j]):
+    j = 0
+    if lines[0].strip() == "Array":  # skip "Array"
+        j += 1
+        if j < n and lines[j].strip() == "(":
             j += 1
-            if j < len(lines) and OPEN.match(lines[j]): j += 1
-            obj, j = parse_obj(j)
-            return obj, j
-        vals = [lines[j]]
+
+    root = obj = {}
+    stack = []  # (parent, key) for every Array still open
+    while j < n:
+        line = lines[j]
+        if line.strip() == ")":
+            j += 1
+            if not stack:
+                break
+            parent, key = stack.pop()
+            parent[key] = obj
+            obj = parent
+            continue
+        kv = _split_key(line)
         j += 1
-        while j < len(lines) and not _KEY.match(lines[j]) and not CLOSE.match(lines[j]):
-            vals.append(lines[j]);
+        if kv is None:
+            continue
+        k, after = kv
+        if not after:  # value starts on the next line
+            after = lines[j]
             j += 1
-        return "\n".join(vals).strip(), j
-
-    def parse_obj(j):
-        obj = {}
-        while j < len(lines):
-            if CLOSE.match(lines[j]): return obj, j + 1
-            m = _KEY.match(lines[j])
-            if not m: j += 1; continue
-            k, after = m.group(1).strip(), m.group(2).strip()
+        if after.strip() == "Array":
+            if j < n and lines[j].strip() == "(":
+                j += 1
+            stack.append((obj, k))
+            obj = {}
+            continue
+        vals = [after]
+        while j < n:
+            nxt = lines[j]
+            if nxt.strip() == ")" or _split_key(nxt) is not None:
+                break
+            vals.append(nxt)
             j += 1
-            if after:
-                if WORD_ARRAY.match(after):
-                    if j < len(lines) and OPEN.match(lines[j]): j += 1
-                    v, j = parse_obj(j)
-                else:
-                    lines.insert(j, after)
-                    v, j = parse_value(j)
-            else:
-                v, j = parse_value(j)
-            obj[k] = v
-        return obj, j
-
-    obj, _ = parse_obj(i)
-    return _to_list_if_numeric(obj)
+        obj[k] = "\n".join(vals).strip()
+
+    # unterminated arrays: attach whatever was collected
+    while stack:
+        parent, key = stack.pop()
+        parent[key] = obj
+        obj = parent
+    return _to_list_if_numeric(root)
 
 
 def _to_list_if_numeric(obj):
     if isinstance(obj, dict):
-        keys = list(obj.keys())
-        # If all keys are digits, try to coerce to a dense 0..N-1 list
-        if keys and all(str(key).isdigit() for key in keys):
-            pairs = sorted(((int(key), val) for key, val in obj.items()), key=lambda pair: pair[0])
-            if all(pairs[i][0] == i for i in range(len(pairs))):
-                return [_to_list_if_numeric(val) for _, val in pairs]
+        # If all keys are digits forming a dense 0..N-1 set, coerce to a list.
+        # One pass: bail on the first non-digit / out-of-range key, otherwise
+        # the bitmask of seen indices is full exactly when the set is dense.
+        n = len(obj)
+        order = []
+        seen = 0
+        for key in obj:
+            if not key.isdigit():
+                break
+            idx = int(key)
+            if idx >= n:
+                break
+            seen |= 1 << idx
+            order.append(idx)
+        else:
+            if n and seen == (1 << n) - 1:
+                out = [None] * n
+                for idx, val in zip(order, obj.values()):
+                    out[idx] = _to_list_if_numeric(val)
+                return out
         # Otherwise keep it a dict and recurse
         return {key: _to_list_if_numeric(val) for key, val in obj.items()}
     if isinstance(obj, list):
@@ -84,10 +125,17 @@ NUMAR_RE = re.compile(r"\[numar\]\s*=>\s*([^\s\]]+)")
 AN_RE = re.compile(r"\[an\]\s*=>\s*([^\s\]]+)")
 
 
+def _needs_norm(text: str) -> bool:
+    """Cheap pre-scan: only text containing '&' can hold an entity to decode."""
+    return "&" in text
+
+
 def _norm_printr(text: str) -> str:
     """Normalize HTML entities so [key] => is detectable."""
     if not text:
         return ""
+    if not _needs_norm(text):
+        return text
     return (text
             .replace("&gt;", ">")
             .replace("&lt;", "<")
@@ -97,36 +145,30 @@ def _norm_printr(text: str) -> str:
 def _find_numar_an_from_obj(obj):
     """Walk any dict/list tree and return first ('numar','an') seen as strings."""
     numar = an = None
-
-    def walk(node):
-        nonlocal numar, an
+    # explicit pre-order DFS: children pushed reversed so they pop in document order
+    stack = [obj]
+    while stack:
+        node = stack.pop()
         if isinstance(node, dict):
-            if numar is None and "numar" in node and node["numar"] is not None:
+            if numar is None and node.get("numar") is not None:
                 numar = str(node["numar"]).strip()
-            if an is None and "an" in node and node["an"] is not None:
+            if an is None and node.get("an") is not None:
                 an = str(node["an"]).strip()
-            for vv in node.values():
-                if numar is not None and an is not None:
-                    break
-                walk(vv)
+            if numar is not None and an is not None:
+                break
+            stack.extend(reversed(node.values()))
         elif isinstance(node, list):
-            for vv in node:
-                if numar is not None and an is not None:
-                    break
-                walk(vv)
-
-    walk(obj)
+            stack.extend(reversed(node))
     return numar, an
 
 
 def _find_numar_an_from_text(text):
     """Fallback if array parse fails: regex scan raw text."""
-    numar = None
-    an = None
-    m1 = NUMAR_RE.search(text or "")
-    if m1: numar = m1.group(1).strip()
-    m2 = AN_RE.search(text or "")
-    if m2: an = m2.group(1).strip()
+    text = text or ""
+    m1 = NUMAR_RE.search(text)
+    numar = m1.group(1).strip() if m1 else None
+    m2 = AN_RE.search(text)
+    an = m2.group(1).strip() if m2 else None
     return numar, an
 
 
@@ -152,6 +194,10 @@ def _find_numar_an_in_dom(soup: BeautifulSoup):
     return numar, an
 
 
+# Start of the next "[KEY] =>" line; ends an _extract_block value.
+NEXT_KEY_RX = re.compile(r"\n\s*\[[A-Za-z0-9_]+\]\s*=>")
+
+
 def _extract_block(seg: str, key: str) -> str | None:
     """
     Return the value block for a key like [articol] => ...,
@@ -159,13 +205,13 @@ def _extract_block(seg: str, key: str) -> str | None:
     Works with HTML entities and preserves newlines.
     """
     seg = _norm_printr(seg)
-    # Match "[articol] => <anything until next key line or end>"
-    m = re.search(
-        rf"^\s*\[{re.escape(key)}\]\s*=>\s*(.*?)(?=\n\s*\[[A-Za-z0-9_]+\]\s*=>|\Z)",
-        seg,
-        re.S | re.M,
-    )
-    return m.group(1) if m else None
+    # Find "[articol] => ", then jump straight to the next key line (or end)
+    # instead of testing a lookahead after every character of the value.
+    m = re.search(rf"^\s*\[{re.escape(key)}\]\s*=>\s*", seg, re.M)
+    if not m:
+        return None
+    end = NEXT_KEY_RX.search(seg, m.end())
+    return seg[m.end():end.start() if end else len(seg)]
 
 
 def _dedent_preserve_newlines(s: str) -> str:
@@ -190,12 +236,14 @@ def _dedent_preserve_newlines(s: str) -> str:
 ARTICOL_ID = re.compile(r"^articol(\d+)$")
 
 
-def extract_from_col_lg_12(soup: BeautifulSoup, log: logging.Logger, file_errors: list):
+def extract_from_col_lg_12(soup: BeautifulSoup, log: logging.Logger, file_errors: list,
+                           page_meta: tuple | None = None):
     """
     Yield one JSON-able dict per #articolNNNN block under any div.col-lg-12.
     Logs warnings if expected bits are missing.
+    page_meta is the page-level (numar, an); looked up from the DOM if not given.
     """
-    page_numar, page_an = _find_numar_an_in_dom(soup)
+    page_numar, page_an = page_meta if page_meta is not None else _find_numar_an_in_dom(soup)
     found_any = False
     for col in soup.select("div.col-lg-12"):
         for block in col.find_all("div", id=ARTICOL_ID):
@@ -253,64 +301,101 @@ def extract_from_col_lg_12(soup: BeautifulSoup, log: logging.Logger, file_errors
 
 
 # ---------- robust modal extractor ----------
-def _get_articole_block(raw: str):
+def _array_key_head(line: str):
+    """For a '... => Array' line return the text before '=>', else None."""
+    t = line.rstrip()
+    if not t.endswith("Array"):
+        return None
+    head = t[:-5].rstrip()
+    if not head.endswith("=>"):
+        return None
+    return head[:-2].rstrip()
+
+
+def _skip_to_close(lines: list, j: int) -> int:
+    """From just inside an open '(' return the index past its matching ')'."""
+    depth = 1
+    n = len(lines)
+    while j < n and depth > 0:
+        t = lines[j].strip()
+        if t == "(":
+            depth += 1
+        elif t == ")":
+            depth -= 1
+        j += 1
+    return j
+
+
+def _split_articole(raw: str):
+    """
+    Find the [articole] => Array ( ... ) block of a print_r dump and split it
+    into its top-level [N] => Array ( ... ) items, in one pass over the lines.
+    Returns None if there is no (non-empty) articole block.
+    """
     lines = raw.splitlines()
+    n = len(lines)
     for i, l in enumerate(lines):
-        if re.search(r"\[articole\]\s*=>\s*Array\s*$", l):
-            j = i + 1
-            while j < len(lines) and not re.match(r"^\s*\(\s*$", lines[j]):
-                j += 1
-            if j >= len(lines): return None
-            depth = 1;
-            j += 1;
-            start = j
-            while j < len(lines) and depth > 0:
-                if j + 1 < len(lines) and re.match(r"^\s*Array\s*$", lines[j]) and re.match(r"^\s*\(\s*$",
-                                                                                            lines[j + 1]):
-                    depth += 1;
-                    j += 2;
+        if "[articole]" not in l:
+            continue
+        head = _array_key_head(l)
+        if head is None or not head.endswith("[articole]"):
+            continue
+        j = i + 1
+        while j < n and lines[j].strip() != "(":
+            j += 1
+        if j >= n:
+            return None
+        end = _skip_to_close(lines, j + 1)
+        block = lines[j + 1:end - 1]
+        if not block or block == [""]:
+            return None
+        # the block used to be re-joined and split again, which drops one trailing blank
+        if block[-1] == "":
+            block.pop()
+
+        items, k, m = [], 0, len(block)
+        while k < m:
+            head = _array_key_head(block[k])
+            if head is not None and k + 1 < m and block[k + 1].strip() == "(":
+                h = head.lstrip()
+                if h.startswith("[") and h.endswith("]") and h[1:-1].isdecimal():
+                    end = _skip_to_close(block, k + 2)
+                    items.append("\n".join(block[k + 2:end - 1]))
+                    k = end
                     continue
-                if re.match(r"^\s*\(\s*$", lines[j]): depth += 1; j += 1; continue
-                if re.match(r"^\s*\)\s*$", lines[j]): depth -= 1; j += 1; continue
-                j += 1
-            return "\n".join(lines[start:j - 1])
+            k += 1
+        return items
     return None
 
 
-def _split_top_level_articole_items(block_text: str):
-    lines = block_text.splitlines()
-    items, i = [], 0
-    while i < len(lines):
-        if re.match(r"^\s*\[\d+\]\s*=>\s*Array\s*$", lines[i]) and i + 1 < len(lines) and re.match(r"^\s*\(\s*$",
-                                                                                                   lines[i + 1]):
-            depth = 1;
-            i += 2;
-            start = i
-            while i < len(lines) and depth > 0:
-                if i + 1 < len(lines) and re.match(r"^\s*Array\s*$", lines[i]) and re.match(r"^\s*\(\s*$",
-                                                                                            lines[i + 1]):
-                    depth += 1;
-                    i += 2;
-                    continue
-                if re.match(r"^\s*\(\s*$", lines[i]): depth += 1; i += 1; continue
-                if re.match(r"^\s*\)\s*$", lines[i]): depth -= 1; i += 1; continue
-                i += 1
-            items.append("\n".join(lines[start:i - 1]))
-        else:
-            i += 1
-    return items
+# Scalar keys of one [articole] item. The value is not consumed, so one
+# finditer pass sees every key line. Same matching as the old per-key
+# "(?!Array)(.*)" searches: "\s*" can back off one space before the lookahead,
+# so "[id] => Array" still yields "Array" (kept as-is, output unchanged).
+ITEM_SCALAR_RX = re.compile(
+    r"\[(?P<key>id|numesocietate|numesocietateinit|titlu|buletinid)\]\s*=>\s*(?!Array)"
+)
+ITEM_ARRAY_FIRST_RX = {
+    name: re.compile(rf"\[{name}\]\s*=>\s*Array\s*\(\s*\[\d+\]\s*=>\s*([^\)\n]*)")
+    for name in ("regcom", "cif")
+}
 
 
 def _parse_articole_item(seg: str):
-    def grab_scalar(name):
-        m = re.search(rf"\[{re.escape(name)}\]\s*=>\s*(?!Array)(.*)", seg)
-        return m.group(1).strip() if m else None
+    # first occurrence of each scalar key, value = rest of its line
+    scalars = {}
+    for m in ITEM_SCALAR_RX.finditer(seg):
+        if m.group("key") not in scalars:
+            nl = seg.find("\n", m.end())
+            scalars[m.group("key")] = seg[m.end():nl if nl != -1 else len(seg)].strip()
+            if len(scalars) == 5:
+                break
 
     def grab_array_first(name):
-        m = re.search(rf"\[{re.escape(name)}\]\s*=>\s*Array\s*\(\s*\[\d+\]\s*=>\s*([^\)\n]*)", seg, re.S)
+        m = ITEM_ARRAY_FIRST_RX[name].search(seg)
         return m.group(1).strip() if m else None
 
-    company = (grab_scalar("numesocietate") or grab_scalar("numesocietateinit") or "").strip()
+    company = (scalars.get("numesocietate") or scalars.get("numesocietateinit") or "").strip()
 
     articol_raw = _extract_block(seg, "articol")
     articol_text = _dedent_preserve_newlines(articol_raw)
@@ -319,12 +404,12 @@ def _parse_articole_item(seg: str):
     print_r_item = _dedent_preserve_newlines(seg)
 
     return {
-        "id": grab_scalar("id"),
+        "id": scalars.get("id"),
         "company": company,
-        "title": grab_scalar("titlu") or "",
+        "title": scalars.get("titlu") or "",
         "regcom": grab_array_first("regcom") or "",
         "cif": grab_array_first("cif") or "",
-        "buletinid": grab_scalar("buletinid") or "",
+        "buletinid": scalars.get("buletinid") or "",
         "articol_text": articol_text,  # cleaned body for "text"
         "print_r_item": print_r_item,  # <<< the whole [id]..[titlu] block you asked for
     }
@@ -335,20 +420,20 @@ def _extract_articles_from_print_r(raw: str):
     Robust extractor for articles list from a modal <pre> print_r.
     Works even if the general PHP array parser squashes siblings.
     """
-    block = _get_articole_block(raw)
-    if not block:
+    parts = _split_articole(raw)
+    if not parts:
         return []
-    parts = _split_top_level_articole_items(block)
     return [_parse_articole_item(p) for p in parts]
 
 
-def extract_from_modals(soup: BeautifulSoup, log: logging.Logger):
+def extract_from_modals(soup: BeautifulSoup, log: logging.Logger, page_meta: tuple | None = None):
     """
     Yield:
       - one dict per modal summarizing companies/articles found
       - and one dict per modal-article item (type='modal_article') for convenience
+    page_meta is the page-level (numar, an); looked up from the DOM if not given.
     """
-    page_numar, page_an = _find_numar_an_in_dom(soup)
+    page_numar, page_an = page_meta if page_meta is not None else _find_numar_an_in_dom(soup)
     modals = soup.select("div.modal.fade.bs-example-modal-lg")
     if not modals:
         log.info("No modals (bs-example-modal-lg) found")
@@ -367,8 +452,8 @@ def extract_from_modals(soup: BeautifulSoup, log: logging.Logger):
                 continue
 
             # only handle <pre> that actually has the articole list
-            block = _get_articole_block(raw)
-            if not block:
+            items = _split_articole(raw)
+            if items is None:
                 continue
 
             used_pre = True
@@ -382,8 +467,7 @@ def extract_from_modals(soup: BeautifulSoup, log: logging.Logger):
             except Exception:
                 pass
 
-            # split the articole block into top-level items and parse each
-            items = _split_top_level_articole_items(block)
+            # parse each top-level item of the articole block
             for seg in items:
                 rec = _parse_articole_item(seg)
 
@@ -451,75 +535,111 @@ def setup_logger(logfile: Path) -> logging.Logger:
 
 
 # ---------- per-file driver ----------
-def process_file(html_path: Path, out_dir: Path, log: logging.Logger):
+def _json_bytes(obj) -> bytes:
+    """UTF-8 JSON with 2-space indent; orjson gives the same bytes as json.dumps here."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+# only the tags the extractors look at: article/modal divs, <pre> dumps, links, numar/an inputs
+PAGE_STRAINER = SoupStrainer(["div", "input", "pre", "a"])
+
+
+def _load_soup(html_path: Path) -> BeautifulSoup:
+    """Parse with lxml straight from bytes (bs4 picks the encoding: declared charset, then UTF-8); html.parser if lxml is missing."""
+    data = html_path.read_bytes()
+    try:
+        return BeautifulSoup(data, "lxml", parse_only=PAGE_STRAINER)
+    except Exception:
+        return BeautifulSoup(data.decode("utf-8", errors="ignore"), "html.parser", parse_only=PAGE_STRAINER)
+
+
+def process_file(html_path: Path, out_dir: Path, log: logging.Logger, jsonl: bool = False):
     per_file_errors = []
     created_articles = 0
     created_modals = 0
     created_modal_articles = 0
 
     try:
-        soup = BeautifulSoup(html_path.read_text(encoding="utf-8", errors="ignore"), "html.parser")
+        soup = _load_soup(html_path)
     except Exception as e:
         log.error(f"Failed to read/parse HTML: {html_path} | {e}")
         return {"file": html_path.name, "articles": 0, "modals": 0, "modal_articles": 0, "errors": [f"read_error: {e}"]}
 
-    # 1) articole din .col-lg-12
-    for item in extract_from_col_lg_12(soup, log, per_file_errors):
-        try:
-            entry = Entry(
-                type="article",
-                company_name=item.get("company"),
-                article_id=item.get("article_id"),
-                bulletin_id=item.get("bulletin_id"),
-                list_parent_classes=item.get("list_parent_classes"),
-                collapse_id=item.get("collapse_id"),
-                source_href=item.get("source_href"),
-                raw_text=item.get("text") or "",
-                number=item.get("numar"),
-                year=item.get("an"),
-                meta=MetaInfo()  # gol, că nu extragem meta aici
-            )
-            comp = (entry.company_name or "unknown").lower().replace(" ", "")
-            out = out_dir / f"{comp}.{entry.article_id}.{entry.bulletin_id}.json"
-            out.write_text(json.dumps(entry.model_dump(), ensure_ascii=False, indent=2), encoding="utf-8")
-            created_articles += 1
-            log.info(f"[article] {html_path.name} -> {out.name}")
-        except Exception as e:
-            msg = f"write_article_error(articol{item.get('article_id')}): {e}"
-            per_file_errors.append(msg)
-            log.error(msg)
-
-    # 2) articole din modale
-    for modal in extract_from_modals(soup, log):
-        try:
-            numar = modal.get("numar")
-            an = modal.get("an")
-
-            for it in modal.get("items", []):
-                if it.get("type") != "modal_article":
-                    continue
+    # numar/an din input-urile paginii, o singură dată per fișier
+    page_meta = _find_numar_an_in_dom(soup)
 
+    # --jsonl: all entries of this page go to one <page>.jsonl instead of a file each
+    jsonl_path = out_dir / f"{html_path.stem}.jsonl"
+    try:
+        sink_ctx = jsonl_path.open("wb") if jsonl else nullcontext()
+    except OSError as e:
+        log.error(f"Failed to open JSONL output: {jsonl_path} | {e}")
+        return {"file": html_path.name, "articles": 0, "modals": 0, "modal_articles": 0, "errors": [f"jsonl_open_error: {e}"]}
+    with sink_ctx as sink:
+        def write_entry(entry: Entry, name: str) -> str:
+            if sink is None:
+                (out_dir / name).write_bytes(entry_json(entry))
+                return name
+            sink.write(entry_json(entry, indent=False) + b"\n")
+            return jsonl_path.name
+
+        # 1) articole din .col-lg-12
+        for item in extract_from_col_lg_12(soup, log, per_file_errors, page_meta):
+            try:
                 entry = Entry(
                     type="article",
-                    company_name=it.get("company"),
-                    article_id=it.get("id"),
-                    bulletin_id=it.get("buletinid"),
-                    raw_text=it.get("articol_text") or "",
-                    number=numar,
-                    year=an,
-                    meta=MetaInfo()  # gol
+                    company_name=item.get("company"),
+                    article_id=item.get("article_id"),
+                    bulletin_id=item.get("bulletin_id"),
+                    list_parent_classes=item.get("list_parent_classes"),
+                    collapse_id=item.get("collapse_id"),
+                    source_href=item.get("source_href"),
+                    raw_text=item.get("text") or "",
+                    number=item.get("numar"),
+                    year=item.get("an"),
+                    meta=MetaInfo()  # gol, că nu extragem meta aici
                 )
-
-                slug = (entry.company_name or "unknown").lower().replace(" ", "")
-                out = out_dir / f"{slug}.{entry.article_id}.{entry.bulletin_id}.json"
-                out.write_text(json.dumps(entry.model_dump(), ensure_ascii=False, indent=2), encoding="utf-8")
-                created_modals += 1
-                log.info(f"[modal_article] {html_path.name} -> {out.name}")
-
-        except Exception as e:
-            msg = f"write_modal_error(modal#{modal.get('modal_index')}): {e}"
-            per_file_errors.append(msg)
-            log.error(msg)
+                comp = (entry.company_name or "unknown").lower().replace(" ", "")
+                target = write_entry(entry, f"{comp}.{entry.article_id}.{entry.bulletin_id}.json")
+                created_articles += 1
+                log.info(f"[article] {html_path.name} -> {target}")
+            except Exception as e:
+                msg = f"write_article_error(articol{item.get('article_id')}): {e}"
+                per_file_errors.append(msg)
+                log.error(msg)
+
+        # 2) articole din modale
+        for modal in extract_from_modals(soup, log, page_meta):
+            try:
+                numar = modal.get("numar")
+                an = modal.get("an")
+
+                for it in modal.get("items", []):
+                    if it.get("type") != "modal_article":
+                        continue
+
+                    entry = Entry(
+                        type="article",
+                        company_name=it.get("company"),
+                        article_id=it.get("id"),
+                        bulletin_id=it.get("buletinid"),
+                        raw_text=it.get("articol_text") or "",
+                        number=numar,
+                        year=an,
+                        meta=MetaInfo()  # gol
+                    )
+
+                    slug = (entry.company_name or "unknown").lower().replace(" ", "")
+                    target = write_entry(entry, f"{slug}.{entry.article_id}.{entry.bulletin_id}.json")
+                    created_modals += 1
+                    log.info(f"[modal_article] {html_path.name} -> {target}")
+
+            except Exception as e:
+                msg = f"write_modal_error(modal#{modal.get('modal_index')}): {e}"
+                per_file_errors.append(msg)
+                log.error(msg)
 
     return {
         "file": html_path.name,
@@ -530,6 +650,42 @@ def process_file(html_path: Path, out_dir: Path, log: logging.Logger):
     }
 
 
+# ---------- parallel driver ----------
+def _init_worker(log_queue):
+    """Send this worker's slim_extract records to the parent's handlers."""
+    logger = logging.getLogger("slim_extract")
+    logger.setLevel(logging.INFO)
+    for h in list(logger.handlers):
+        logger.removeHandler(h)
+    logger.addHandler(QueueHandler(log_queue))
+
+
+def _process_one(html_path: Path, out_dir: Path, log: logging.Logger, jsonl: bool):
+    log.info(f"Processing: {html_path}")
+    return process_file(html_path, out_dir, log, jsonl)
+
+
+def _worker(html_path: Path, out_dir: Path, jsonl: bool):
+    return _process_one(html_path, out_dir, logging.getLogger("slim_extract"), jsonl)
+
+
+def run_files(files: list, out_dir: Path, log: logging.Logger, workers: int, jsonl: bool = False):
+    """Yield process_file results in input order, over `workers` processes when > 1."""
+    if workers <= 1 or len(files) <= 1:
+        for f in files:
+            yield _process_one(f, out_dir, log, jsonl)
+        return
+
+    log_queue = multiprocessing.Queue()
+    listener = QueueListener(log_queue, *log.handlers, respect_handler_level=True)
+    listener.start()
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(log_queue,)) as ex:
+            yield from ex.map(partial(_worker, out_dir=out_dir, jsonl=jsonl), files)
+    finally:
+        listener.stop()
+
+
 # ---------- cli ----------
 def main():
     ap = argparse.ArgumentParser(description="Extractor for .col-lg-12 articles and modal arrays (robust).")
@@ -538,6 +694,10 @@ def main():
     ap.add_argument("--recursive", action="store_true", help="Recurse into subfolders")
     ap.add_argument("--log", dest="logfile", default="extract.log", help="Path to the log file (default: extract.log)")
     ap.add_argument("--report", dest="report", default="run_report.json", help="Path to summary JSON report")
+    ap.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                    help="Worker processes (default: CPU count; 1 = serial)")
+    ap.add_argument("--jsonl", action="store_true",
+                    help="Write one <page>.jsonl per input file instead of one JSON file per entry")
     args = ap.parse_args()
 
     in_dir = Path(args.indir)
@@ -554,19 +714,20 @@ def main():
 
     run_summary = {"total_files": len(files), "processed": 0, "files": []}
 
-    for f in files:
-        logger.info(f"Processing: {f}")
-        result = process_file(f, out_dir, logger)
+    # running totals, kept as results come in
+    totals = {"articles": 0, "modals": 0, "modal_articles": 0, "errors": 0}
+    for result in run_files(files, out_dir, logger, args.workers, args.jsonl):
         run_summary["files"].append(result)
         run_summary["processed"] += 1
+        totals["articles"] += result["articles"]
+        totals["modals"] += result["modals"]
+        totals["modal_articles"] += result.get("modal_articles", 0)
+        totals["errors"] += len(result["errors"])
 
-    # quick totals
-    run_summary["total_articles"] = sum(x["articles"] for x in run_summary["files"])
-    run_summary["total_modals"] = sum(x["modals"] for x in run_summary["files"])
-    run_summary["total_modal_articles"] = sum(x.get("modal_articles", 0) for x in run_summary["files"])
-    run_summary["total_errors"] = sum(len(x["errors"]) for x in run_summary["files"])
+    for key, value in totals.items():
+        run_summary[f"total_{key}"] = value
 
-    report_path.write_text(json.dumps(run_summary, ensure_ascii=False, indent=2), encoding="utf-8")
+    report_path.write_bytes(_json_bytes(run_summary))
     logger.info(f"Done. JSON in: {out_dir.resolve()}")
     logger.info(f"Log:  {logfile.resolve()}")
     logger.info(f"Report: {report_path.resolve()}")
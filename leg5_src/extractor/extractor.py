@@ -1,12 +1,23 @@
 from __future__ import annotations
 import argparse
 import logging
+import os
 import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from functools import partial
 from pathlib import Path
 from typing import List, Tuple, Optional
 from bs4 import BeautifulSoup
 
-from leg5_src.extractor.model import MetaInfo, Entry
+try:
+    import ahocorasick  # optional: one-pass lookup of <strong> texts
+except ImportError:
+    ahocorasick = None
+
+from leg5_src.extractor.model import MetaInfo, Entry, entry_json
+from leg5_src.prefilter import build_prefilter, candidate_patterns
 
 # ---------------- Logging ----------------
 LOG_FILE = Path("leg5_extractor_logger.log")
@@ -24,6 +35,10 @@ LEGAL_FORM_RX = re.compile(
     r'\b(S\.?\s*A\.?|S\.?\s*R\.?\s*L\.?|P\.?\s*F\.?\s*A\.?|S\.?\s*N\.?\s*C\.?)\b', re.I
 )
 END_MARK_RX = re.compile(r'\(\s*\d+\s*/\s*\d{1,3}(?:\.\d{3})+\s*\)')
+# The field patterns below are searched one by one on purpose: their matches
+# can overlap (e.g. the J.. number inside an EUID, an address fallback that
+# runs over "sediul:"), so a single fused alternation would hide hits, and
+# it also loses re's literal-prefix scan (measured ~1.5x slower on leg5 chunks).
 RE_CUI = re.compile(r'\b(?:CUI|Cod(?:ul)?\s+unic(?:\s+de)?\s+înregistrare)\s*[:\-]?\s*(?:RO\s*)?(\d{6,10})\b', re.I)
 RE_REGNO = re.compile(r'\b[JCF]\s*\d{1,2}/\d{1,6}/\d{4}\b', re.I)
 RE_EUID = re.compile(r'\b(?:ROONRC\.[A-Z]\d+|[A-Z]{2,}\.?ONRC\.[A-Z]\d{1,2}/\d{3,8}/\d{4})\b', re.I)
@@ -31,19 +46,21 @@ RE_CAEN_LISTLINE = re.compile(r'(?m)^\s*(\d{4})\s*-\s+')
 RE_CAEN_INLINE = re.compile(r'\b(?:CAEN|grupa\s+CAEN)\D+(\d{4})\b', re.I)
 RE_CAPITAL = re.compile(r'\bcapital\s+social\s*:\s*([^;\n]+)', re.I)
 STOP_WORDS = r"(?:înregistrată|având|reprezentând|la\s+data\s+de|domiciliat|identificat|deținând|cod\s+unic|CUI|am\s+decis|$)"
+# shortest run of address text followed by an optional ", " and a stop word
+UNTIL_STOP = rf'([^;\n]+?)(?=,?\s*{STOP_WORDS})'
 
 RE_SEDIU_COLON = re.compile(
-    rf'\b(?:sediul\s+social|sediul)\s*:\s*([^;\n]+?)(?=,?\s*{STOP_WORDS})',
+    rf'\b(?:sediul\s+social|sediul)\s*:\s*{UNTIL_STOP}',
     re.I
 )
 
 RE_SEDIU_IN = re.compile(
-    rf'\bcu\s+sediul\s+social\s+(?:în|in)\s+([^;\n]+?)(?=,?\s*{STOP_WORDS})',
+    rf'\bcu\s+sediul\s+social\s+(?:în|in)\s+{UNTIL_STOP}',
     re.I
 )
 
 RE_ADDRESS_FALLBACK = re.compile(
-    rf'\bîn\s+(satul|municipiul|orașul|mun\.?|jud\.?|com\.)\s+([^;\n]+?)(?=,?\s*{STOP_WORDS})',
+    rf'\bîn\s+(satul|municipiul|orașul|mun\.?|jud\.?|com\.)\s+{UNTIL_STOP}',
     re.I
 )
 RE_BULLETIN_H1 = re.compile(
@@ -53,19 +70,45 @@ RE_BULLETIN_H1 = re.compile(
 
 RE_DOC_TYPE = re.compile(r'\b(NOTIFICARE|HOT[ĂA]R[ÂA]RE|DECIZIE|ÎN[ȘS]TIIN[ȚT]ARE)\b', re.I)
 
+# checked in order against upper-cased text, first hit wins
+RE_LEGAL_TYPES = (
+    ("SA", re.compile(r'\bS\.?\s*A\.?\b')),
+    ("SRL", re.compile(r'\bS\.?\s*R\.?\s*L\.?\b')),
+    ("PFA", re.compile(r'\bP\.?\s*F\.?\s*A\.?\b')),
+    ("SNC", re.compile(r'\bS\.?\s*N\.?\s*C\.?\b')),
+)
+RE_HSPACE = re.compile(r'[ \t]+')
+RE_BLANK_LINES = re.compile(r'\n{2,}')
+
+# single-match fields looked up by _extract_entry
+FIELD_PATTERNS = (
+    RE_CUI, RE_REGNO, RE_EUID, RE_CAPITAL,
+    RE_SEDIU_COLON, RE_SEDIU_IN, RE_ADDRESS_FALLBACK, RE_DOC_TYPE,
+)
+
+
+FIELD_PREFILTER = build_prefilter(FIELD_PATTERNS, logger)
+
 
 # ---------------- Helpers ----------------
-def _get_soup(html: str) -> BeautifulSoup:
+def _get_soup(html: str | bytes) -> BeautifulSoup:
     try:
         return BeautifulSoup(html, "lxml")
     except Exception:
         return BeautifulSoup(html, "html.parser")
 
 
+def _needs_norm(s: str) -> bool:
+    """True if _clean_text has more to do than strip()."""
+    return '\xa0' in s or '\t' in s or '  ' in s or '\n\n' in s
+
+
 def _clean_text(s: str) -> str:
+    if not _needs_norm(s):
+        return s.strip()
     s = s.replace('\xa0', ' ')
-    s = re.sub(r'[ \t]+', ' ', s)
-    s = re.sub(r'\n{2,}', '\n', s)
+    s = RE_HSPACE.sub(' ', s)
+    s = RE_BLANK_LINES.sub('\n', s)
     return s.strip()
 
 
@@ -75,10 +118,9 @@ def _full_text(soup: BeautifulSoup) -> str:
 
 def _categorize_legal_form(text: str) -> str:
     t = (text or "").upper()
-    if re.search(r'\bS\.?\s*A\.?\b', t): return "SA"
-    if re.search(r'\bS\.?\s*R\.?\s*L\.?\b', t): return "SRL"
-    if re.search(r'\bP\.?\s*F\.?\s*A\.?\b', t): return "PFA"
-    if re.search(r'\bS\.?\s*N\.?\s*C\.?\b', t): return "SNC"
+    for tag, rx in RE_LEGAL_TYPES:
+        if rx.search(t):
+            return tag
     return "OTHER"
 
 
@@ -87,17 +129,36 @@ def _bucket(legal_type: str | None) -> str:
     return t if t in {"SRL", "SA", "PFA", "SNC"} else "OTHER"
 
 
-def _find_segments_via_strong(html: str) -> List[Tuple[int, int, str]]:
-    soup = _get_soup(html)
-    full = _full_text(soup)
+def _first_positions(full: str, texts: List[str]) -> dict:
+    """Map each text to full.find(text), in a single Aho-Corasick sweep when available."""
+    # an automaton with no words refuses iter(), so pages without candidates skip it
+    if ahocorasick is None or not texts:
+        return {t: full.find(t) for t in texts}
+    automaton = ahocorasick.Automaton()
+    for t in texts:
+        automaton.add_word(t, t)
+    automaton.make_automaton()
+    positions = {}
+    # per pattern, the first reported end is also its leftmost start
+    for end, t in automaton.iter(full):
+        if t not in positions:
+            positions[t] = end - len(t) + 1
+            if len(positions) == len(texts):
+                break
+    return {t: positions.get(t, -1) for t in texts}
+
+
+def _find_segments_via_strong(soup: BeautifulSoup, full: str) -> List[Tuple[int, int, str]]:
+    """full is _full_text(soup); the caller already has both, so nothing is re-parsed here."""
     segments: List[Tuple[int, int, str]] = []
-    strongs = []
+    st_texts = []
     for st in soup.find_all('strong'):
         st_text = _clean_text(st.get_text(" ").strip())
         if st_text and LEGAL_FORM_RX.search(st_text):
-            sidx = full.find(st_text)
-            if sidx != -1:
-                strongs.append((sidx, st_text))
+            st_texts.append(st_text)
+    # repeated <strong> texts resolve to the same first occurrence
+    positions = _first_positions(full, list(dict.fromkeys(st_texts)))
+    strongs = [(positions[t], t) for t in st_texts if positions[t] != -1]
     strongs.sort(key=lambda x: x[0])
     for sidx, st_text in strongs:
         m = END_MARK_RX.search(full, pos=sidx)
@@ -120,32 +181,50 @@ def _extract_bulletin_meta(soup: BeautifulSoup):
     return num, full_date, year
 
 
+def _candidate_patterns(chunk: str):
+    """FIELD_PATTERNS that may match chunk (all of them without hyperscan)."""
+    found = candidate_patterns(FIELD_PREFILTER, FIELD_PATTERNS, chunk, logger)
+    return FIELD_PATTERNS if found is None else found
+
+
 def _extract_entry(chunk: str, name_hint: Optional[str], bulletin_info: tuple) -> Entry:
-    cui = (RE_CUI.search(chunk).group(1) if RE_CUI.search(chunk) else None)
-    regno = (RE_REGNO.search(chunk).group(0) if RE_REGNO.search(chunk) else None)
-    euid = (RE_EUID.search(chunk).group(0) if RE_EUID.search(chunk) else None)
+    candidates = _candidate_patterns(chunk)
 
-    caen_codes: list[str] = []
+    def search(rx):
+        return rx.search(chunk) if rx in candidates else None
+
+    m = search(RE_CUI)
+    cui = m.group(1) if m else None
+    m = search(RE_REGNO)
+    regno = m.group(0) if m else None
+    m = search(RE_EUID)
+    euid = m.group(0) if m else None
+
+    # dict as an ordered set: first occurrence wins, no separate dedupe pass
+    caen_seen: dict[str, None] = {}
     for m in RE_CAEN_LISTLINE.finditer(chunk):
-        caen_codes.append(m.group(1))
-    for m in RE_CAEN_INLINE.finditer(chunk):
-        caen_codes.append(m.group(1))
-    caen_codes = list(dict.fromkeys(caen_codes))
+        caen_seen[m.group(1)] = None
+    # the inline form needs a literal "CAEN"; skip its case-insensitive
+    # word-boundary scan on the (many) chunks that never mention it
+    if "caen" in chunk.lower():
+        for m in RE_CAEN_INLINE.finditer(chunk):
+            caen_seen[m.group(1)] = None
+    caen_codes = list(caen_seen)
 
     capital = None
-    if m_cap := RE_CAPITAL.search(chunk):
+    if m_cap := search(RE_CAPITAL):
         capital = m_cap.group(1).strip().rstrip(';.')
 
     address = None
-    if m := RE_SEDIU_COLON.search(chunk):
+    if m := search(RE_SEDIU_COLON):
         address = m.group(1).strip(' ,;.')
-    elif m := RE_SEDIU_IN.search(chunk):
+    elif m := search(RE_SEDIU_IN):
         address = m.group(1).strip(' ,;.')
-    elif m := RE_ADDRESS_FALLBACK.search(chunk):
+    elif m := search(RE_ADDRESS_FALLBACK):
         address = m.group(0).strip(' ,;.')
 
     doc_type = None
-    if m := RE_DOC_TYPE.search(chunk):
+    if m := search(RE_DOC_TYPE):
         doc_type = m.group(1).title()
 
     company_name = name_hint
@@ -180,12 +259,14 @@ def _extract_entry(chunk: str, name_hint: Optional[str], bulletin_info: tuple) -
 
 # ---------------- Main parser ----------------
 def parse_file(path: Path):
-    html = path.read_text(encoding="utf-8", errors="replace")
-    soup = _get_soup(html)
+    # raw bytes: bs4's UnicodeDammit picks the encoding (the declared <meta charset>,
+    # then UTF-8 with replacement). The pages declare UTF-8, so invalid bytes become
+    # U+FFFD, as errors="replace" did; a page declaring another charset would differ.
+    soup = _get_soup(path.read_bytes())
     bulletin_info = _extract_bulletin_meta(soup)
 
     full = _full_text(soup)
-    segs = _find_segments_via_strong(html)
+    segs = _find_segments_via_strong(soup, full)
     out = []
     for sidx, eidx, st_text in segs:
         chunk = _clean_text(full[sidx:eidx])
@@ -195,11 +276,38 @@ def parse_file(path: Path):
     return out
 
 
+def _parse_files(files: List[Path], workers: int):
+    """
+    Yield (path, get_entries) in input order; get_entries() returns parse_file's
+    result or re-raises its error. Files are parsed ahead in a process pool
+    when workers > 1, at most 4 * workers at a time, so only that many files'
+    entries are held at once.
+    """
+    if workers <= 1 or len(files) <= 1:
+        for path in files:
+            yield path, partial(parse_file, path)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        pending = deque()  # (path, future), oldest first
+        for path in files:
+            pending.append((path, ex.submit(parse_file, path)))
+            if len(pending) >= 4 * workers:
+                done_path, fut = pending.popleft()
+                yield done_path, fut.result
+        while pending:
+            done_path, fut = pending.popleft()
+            yield done_path, fut.result
+
+
 def main():
     ap = argparse.ArgumentParser(description="Lege5 structured extractor (no entry_number/year)")
     ap.add_argument("--indir", default="../leg5/Batch_8", help="Input folder")
     ap.add_argument("--outdir", default="../leg5/extracted", help="Output folder")
     ap.add_argument("--recursive", action="store_true")
+    ap.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                    help="Worker processes (default: CPU count; 1 = serial)")
+    ap.add_argument("--jsonl", action="store_true",
+                    help="Append entries to <bucket>/entries.jsonl instead of one JSON file each")
     args = ap.parse_args()
 
     in_dir = Path(args.indir)
@@ -210,23 +318,33 @@ def main():
     files = sorted(in_dir.glob(pattern))
 
     total = 0
-    for html_file in files:
-        try:
-            entries = parse_file(html_file)
-            logger.info(f"{html_file}: {len(entries)} segment(s)")
-            for idx, entry in enumerate(entries, start=1):
-                bucket = _bucket(entry.meta.legal_type)
-                outp = out_dir / bucket
-                outp.mkdir(parents=True, exist_ok=True)
-                safe = re.sub(r'[^A-Za-z0-9\-_\.\s]', '', (entry.company_name or "entry")).strip().replace(' ', '_')
-                fname = f"{safe}__{idx:03d}.json"
-                with (outp / fname).open("w", encoding="utf-8") as f:
-                    f.write(entry.model_dump_json(indent=2))
-                total += 1
-        except Exception as e:
-            logger.exception(f"Error on {html_file}: {e}")
-
-    print(f"Done. Wrote {total} JSON files to {out_dir}")
+    with ExitStack() as stack:
+        sinks = {}  # bucket -> open entries.jsonl, only with --jsonl
+        for html_file, get_entries in _parse_files(files, args.workers):
+            try:
+                entries = get_entries()
+                logger.info(f"{html_file}: {len(entries)} segment(s)")
+                for idx, entry in enumerate(entries, start=1):
+                    bucket = _bucket(entry.meta.legal_type)
+                    outp = out_dir / bucket
+                    if args.jsonl:
+                        sink = sinks.get(bucket)
+                        if sink is None:
+                            outp.mkdir(parents=True, exist_ok=True)
+                            sink = sinks[bucket] = stack.enter_context((outp / "entries.jsonl").open("wb"))
+                        sink.write(entry_json(entry, indent=False) + b"\n")
+                        total += 1
+                        continue
+                    outp.mkdir(parents=True, exist_ok=True)
+                    safe = re.sub(r'[^A-Za-z0-9\-_\.\s]', '', (entry.company_name or "entry")).strip().replace(' ', '_')
+                    fname = f"{safe}__{idx:03d}.json"
+                    with (outp / fname).open("wb") as f:
+                        f.write(entry_json(entry))
+                    total += 1
+            except Exception as e:
+                logger.exception(f"Error on {html_file}: {e}")
+
+    print(f"Done. Wrote {total} {'JSONL entries' if args.jsonl else 'JSON files'} to {out_dir}")
     print(f"Logs: {LOG_FILE}")
 
 
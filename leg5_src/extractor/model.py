@@ -2,6 +2,11 @@ from __future__ import annotations
 from pydantic import BaseModel, Field
 from typing import Optional, Union, List
 
+try:
+    import orjson  # optional: faster JSON output
+except ImportError:
+    orjson = None
+
 
 class MetaInfo(BaseModel):
     cui: Optional[str] = None
@@ -26,3 +31,10 @@ class Entry(BaseModel):
     list_parent_classes: Optional[str] = None
     collapse_id: Optional[str] = None
     source_href: Optional[str] = None
+
+
+def entry_json(entry: Entry, indent: bool = True) -> bytes:
+    """Same bytes as entry.model_dump_json(indent=2 or None), via orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(entry.model_dump(), option=orjson.OPT_INDENT_2 if indent else 0)
+    return entry.model_dump_json(indent=2 if indent else None).encode("utf-8")
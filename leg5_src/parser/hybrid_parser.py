@@ -1,9 +1,18 @@
 # leg_hybrid_parser.py (modular)
 # -*- coding: utf-8 -*-
 from __future__ import annotations
-import argparse, json, sys, logging, re
+import argparse, json, os, sys, logging, re
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import nullcontext
+from functools import partial
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, Iterable, Iterator, Optional, Tuple
+
+try:
+    import orjson  # optional: faster JSON in/out
+except ImportError:
+    orjson = None
 
 from parser import extract_structured_company
 from llm_agent import run_llm
@@ -20,22 +29,57 @@ logging.basicConfig(
 logger = logging.getLogger("leg_hybrid_parser")
 
 
+# Characters dropped from output filenames (same whitelist as the extractor's).
+SLUG_DROP_RX = re.compile(r'[^A-Za-z0-9\-_.\s]')
+
+
 def _safe_slug(name: str, max_len: int = 64) -> str:
-    base = re.sub(r'[^A-Za-z0-9\\-_.\\s]', '', name or "entry").strip().replace(' ', '_')
+    base = SLUG_DROP_RX.sub('', name or "entry").strip().replace(' ', '_')
     return (base[:max_len] or 'entry').strip('_')
 
 
-def _iter_segments(indir: Path, recursive: bool):
+def _json_loads(data: bytes) -> Any:
+    return orjson.loads(data) if orjson is not None else json.loads(data.decode("utf-8"))
+
+
+def _json_bytes(obj: Any, indent: bool = True) -> bytes:
+    """UTF-8 JSON, 2-space indent or compact (one NDJSON line); same bytes with or without orjson."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _sorted_entries(path):
+    with os.scandir(path) as it:
+        return iter(sorted(it, key=lambda entry: entry.name))
+
+
+def _segment_paths(indir: Path, recursive: bool):
     base = indir / "SRL"
     if not base.exists():
         return
-    pattern = "**/*.json" if recursive else "*.json"
-    for jp in sorted(base.glob(pattern)):
-        try:
-            seg = json.loads(jp.read_text(encoding="utf-8"))
-            yield jp, seg
-        except Exception as e:
-            logger.exception(f"Failed reading {jp}: {e}")
+    # Depth-first over per-directory sorted listings: the same order as
+    # sorted(base.glob("**/*.json")), but the first path comes out without
+    # listing (and sorting) the whole tree first.
+    stack = [_sorted_entries(base)]
+    while stack:
+        entry = next(stack[-1], None)
+        if entry is None:
+            stack.pop()
+        elif recursive and entry.is_dir(follow_symlinks=False):
+            stack.append(_sorted_entries(entry.path))
+        elif entry.name.endswith(".json") and entry.is_file():
+            yield Path(entry.path)
+
+
+def _read_segment(jp: Path) -> Optional[Dict[str, Any]]:
+    try:
+        return _json_loads(jp.read_bytes())
+    except Exception as e:
+        logger.exception(f"Failed reading {jp}: {e}")
+        return None
 
 
 def _merge_segment_meta(seg: Dict[str, Any], obj: Dict[str, Any]) -> Dict[str, Any]:
@@ -50,6 +94,57 @@ def _merge_segment_meta(seg: Dict[str, Any], obj: Dict[str, Any]) -> Dict[str, A
     return obj
 
 
+def _process_one(jp: Path, force_llm: bool = False,
+                 model: Optional[str] = None) -> Optional[Tuple[Dict[str, Any], str, bool, bool]]:
+    """
+    Read + heuristic parse (+ LLM fallback) of one segment file, run in a worker
+    process so file reads overlap across workers as well.
+    Returns (comp, output filename, LLM requested, LLM result used), or None if
+    the segment could not be read.
+    """
+    seg = _read_segment(jp)
+    if seg is None:
+        return None
+    raw = seg.get("raw_text") or ""
+
+    # 1) fast heuristic
+    comp = extract_structured_company(raw, data_source="Official Gazette - MoF IV")
+    comp = _merge_segment_meta(seg, comp)
+    # no heuristic trigger yet: only --force-llm routes a segment to the LLM
+    need = force_llm
+    used = False
+
+    # 2) LLM fallback
+    if need:
+        llm_comp = run_llm(raw, model_name=model)
+        if llm_comp:
+            llm_comp = _merge_segment_meta(seg, llm_comp)
+            comp = llm_comp
+            used = True
+
+    name = comp.get("name") or seg.get("company_name") or "entry"
+    safe = _safe_slug(name)
+    entry_no = seg.get("entry_number") or "nr"
+    entry_year = seg.get("entry_year") or "yyyy"
+    fname = f"{safe}__{entry_no}-{entry_year}.json"
+    return comp, fname, need, used
+
+
+def _map_bounded(ex: Executor, fn: Callable, items: Iterable, window: int) -> Iterator:
+    """
+    Like ex.map(fn, items), results in input order, but with at most `window`
+    tasks in flight: Executor.map submits the whole iterable up front, which
+    would drain a lazy path walk before the first result comes back.
+    """
+    pending = deque()
+    for item in items:
+        pending.append(ex.submit(fn, item))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
 def main():
     ap = argparse.ArgumentParser(description="Hybrid parser (SRL-only) using modular schema & LLM agent")
     ap.add_argument("--indir", default="../leg5/extractor", help="Input base (expects SRL subfolder)")
@@ -58,6 +153,8 @@ def main():
     ap.add_argument("--recursive", action="store_true", help="Recurse into subfolders")
     ap.add_argument("--model", default=None, help="LLM model name (overrides PYA_MODEL)")
     ap.add_argument("--force-llm", default=False, action="store_true", help="Always call LLM (expensive)")
+    ap.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                    help="Worker processes (default: CPU count; 1 = serial)")
     args = ap.parse_args()
 
     in_dir = Path(args.indir)
@@ -73,36 +170,25 @@ def main():
 
     n_in = n_ok = n_llm = n_llm_used = 0
     nd_path = out_dir / args.ndjson
-    with nd_path.open("w", encoding="utf-8") as nd:
-        for jp, seg in _iter_segments(in_dir, args.recursive) or []:
+    process = partial(_process_one, force_llm=args.force_llm, model=args.model)
+    pool = ProcessPoolExecutor(max_workers=args.workers) if args.workers > 1 else nullcontext()
+    # 1 MiB buffer: a write() syscall per ~1 MiB of records instead of per 8 KiB
+    with nd_path.open("wb", buffering=1 << 20) as nd, pool as ex:
+        paths = _segment_paths(in_dir, args.recursive)
+        # workers read + parse; files and NDJSON are written here, in input order
+        results = _map_bounded(ex, process, paths, 4 * args.workers) if ex else map(process, paths)
+        for res in results:
+            if res is None:
+                continue
+            comp, fname, asked_llm, used_llm = res
             n_in += 1
-            raw = seg.get("raw_text") or ""
-
-            # 1) fast heuristic
-            comp = extract_structured_company(raw, data_source="Official Gazette - MoF IV")
-            comp = _merge_segment_meta(seg, comp)
-            if args.force_llm:
-                need = True
-
-            # 2) LLM fallback
-            if need:
-                n_llm += 1
-                llm_comp = run_llm(raw, model_name=args.model)
-                if llm_comp:
-                    llm_comp = _merge_segment_meta(seg, llm_comp)
-                    comp = llm_comp
-                    n_llm_used += 1
+            n_llm += asked_llm
+            n_llm_used += used_llm
 
             # 3) write
-            name = comp.get("name") or seg.get("company_name") or "entry"
-            safe = _safe_slug(name)
-            entry_no = seg.get("entry_number") or "nr"
-            entry_year = seg.get("entry_year") or "yyyy"
-            fname = f"{safe}__{entry_no}-{entry_year}.json"
-
-            with (out_srl / fname).open("w", encoding="utf-8") as f:
-                json.dump(comp, f, ensure_ascii=False, indent=2)
-            nd.write(json.dumps(comp, ensure_ascii=False) + "\\n")
+            with (out_srl / fname).open("wb") as f:
+                f.write(_json_bytes(comp))
+            nd.write(_json_bytes(comp, indent=False) + b"\n")
             n_ok += 1
 
     summary = (
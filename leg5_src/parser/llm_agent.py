@@ -1,31 +1,151 @@
 from __future__ import annotations
-import os, json, logging
-from typing import Optional, Dict, Any
+import asyncio, functools, hashlib, os, json, logging, sqlite3, time
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Dict, Any, List
 
-from pydantic_ai import Agent
 from leg5_src.parser.models import CompanyModel
 
+if TYPE_CHECKING:
+    from pydantic_ai import Agent
+
 logger = logging.getLogger("leg_llm_agent")
 
+# Written against pydantic-ai 1.x (pip install "pydantic-ai-slim[openai]>=1.0,<2"):
+# Agent(output_type=...) and result.output; 0.x used result_type / result.data.
+
+# Static instructions go in the system prompt so every request shares the same
+# prefix (provider-side prompt caching); only the notice text varies per call.
+RULES = (
+    "Extract structured company data from the Romanian legal notice below.\n"
+    "Rules:\n"
+    "- Do NOT invent data. Leave fields null/empty if not present.\n"
+    "- Preserve Romanian diacritics and original capitalization for names.\n"
+    "- Prefer cui like RO######## if available; registrationNumber like Jxx/xxxxx/yyyy.\n"
+    "- Keep addresses as they appear; infer county/city only if clearly stated."
+)
+
+# On-disk memo of LLM results so reruns over the same notices cost nothing.
+# PYA_CACHE overrides the SQLite path; set it to "" to disable the cache.
+DEFAULT_CACHE_PATH = "../leg5/llm_cache.sqlite"
+CACHE_TTL = 30 * 86400  # seconds
+
+_CACHE_DB = None  # sqlite3.Connection once opened, False if disabled/unavailable
+
+
+@functools.lru_cache(maxsize=8)
+def _agent(model: str) -> Agent:
+    """One Agent (and its HTTP client) per model name, reused across calls."""
+    # Imported on first use: runs that never reach the LLM skip pydantic_ai's
+    # import chain, and a missing install surfaces as a failed call (-> None).
+    from pydantic_ai import Agent
+    return Agent(model=model, system_prompt=RULES, output_type=CompanyModel)
+
+
+def _model_name(model_name: Optional[str]) -> str:
+    return model_name or os.getenv("PYA_MODEL", "openai:gpt-4o-mini")
+
+
+def _cache() -> Optional[sqlite3.Connection]:
+    global _CACHE_DB
+    if _CACHE_DB is None:
+        _CACHE_DB = False
+        path = os.getenv("PYA_CACHE", DEFAULT_CACHE_PATH)
+        if path:
+            try:
+                Path(path).parent.mkdir(parents=True, exist_ok=True)
+                db = sqlite3.connect(path, timeout=30)
+                db.execute("CREATE TABLE IF NOT EXISTS llm_cache "
+                           "(key TEXT PRIMARY KEY, value TEXT NOT NULL, created REAL NOT NULL)")
+                _CACHE_DB = db
+            except Exception as e:
+                logger.warning(f"LLM cache disabled ({path}): {e}")
+    return _CACHE_DB or None
+
+
+def _cache_key(model: str, raw_text: str) -> str:
+    # the rules are part of the key: editing them must not serve stale answers
+    h = hashlib.blake2b(digest_size=20)
+    for part in (model, RULES, raw_text):
+        h.update(part.encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def _cache_get(key: str) -> Optional[Dict[str, Any]]:
+    db = _cache()
+    if db is None:
+        return None
+    try:
+        row = db.execute("SELECT value FROM llm_cache WHERE key = ? AND created > ?",
+                         (key, time.time() - CACHE_TTL)).fetchone()
+    except sqlite3.Error as e:
+        logger.warning(f"LLM cache read failed: {e}")
+        return None
+    return json.loads(row[0]) if row else None
+
+
+def _cache_put(key: str, comp: Dict[str, Any]) -> None:
+    db = _cache()
+    if db is None:
+        return
+    try:
+        with db:
+            db.execute("INSERT OR REPLACE INTO llm_cache (key, value, created) VALUES (?, ?, ?)",
+                       (key, json.dumps(comp, ensure_ascii=False), time.time()))
+    except sqlite3.Error as e:
+        logger.warning(f"LLM cache write failed: {e}")
+
+
+def _result_dict(result) -> Dict[str, Any]:
+    comp: CompanyModel = result.output
+    # JSON-safe dict built directly, no dump-to-text + json.loads round trip
+    return comp.model_dump(mode="json")
+
 
 def run_llm(raw_text: str, model_name: Optional[str] = None) -> Optional[Dict[str, Any]]:
     """Return a dict matching leg_models.Company, or None on failure/missing lib."""
 
-    model = model_name or os.getenv("PYA_MODEL", "gpt-4o-mini")
+    model = _model_name(model_name)
+    key = _cache_key(model, raw_text)
+    comp = _cache_get(key)
+    if comp is not None:
+        return comp
     try:
-        agent = Agent(model=model, response_format=CompanyModel)
-        prompt = (
-            "Extract structured company data from the Romanian legal notice below.\n"
-            "Rules:\n"
-            "- Do NOT invent data. Leave fields null/empty if not present.\n"
-            "- Preserve Romanian diacritics and original capitalization for names.\n"
-            "- Prefer cui like RO######## if available; registrationNumber like Jxx/xxxxx/yyyy.\n"
-            "- Keep addresses as they appear; infer county/city only if clearly stated.\n\n"
-            f"{raw_text}"
-        )
-        result = agent.run(prompt)
-        comp: CompanyModel = result.data
-        return json.loads(comp.model_dump_json())
+        comp = _result_dict(_agent(model).run_sync(raw_text))
     except Exception as e:
         logger.exception(f"LLM extraction failed: {e}")
         return None
+    _cache_put(key, comp)
+    return comp
+
+
+def run_llm_batch(raw_texts: List[str], model_name: Optional[str] = None) -> List[Optional[Dict[str, Any]]]:
+    """run_llm over many notices with the requests in flight concurrently; results keep input order."""
+
+    model = _model_name(model_name)
+    keys = [_cache_key(model, t) for t in raw_texts]
+    out = [_cache_get(k) for k in keys]
+    todo = [i for i, comp in enumerate(out) if comp is None]
+    if not todo:
+        return out
+    try:
+        agent = _agent(model)
+    except Exception as e:
+        logger.exception(f"LLM extraction failed: {e}")
+        return out
+
+    async def one(raw_text: str) -> Optional[Dict[str, Any]]:
+        try:
+            return _result_dict(await agent.run(raw_text))
+        except Exception as e:
+            logger.exception(f"LLM extraction failed: {e}")
+            return None
+
+    async def gather():
+        return await asyncio.gather(*(one(raw_texts[i]) for i in todo))
+
+    for i, comp in zip(todo, asyncio.run(gather())):
+        if comp is not None:
+            _cache_put(keys[i], comp)
+            out[i] = comp
+    return out
@@ -1,9 +1,18 @@
 # source2_structured_extractor.py (refined, rebuilt)
 # -*- coding: utf-8 -*-
 from __future__ import annotations
-import re, uuid
+import logging, re, uuid
 from typing import Dict, Any, List, Optional
 
+try:
+    import ahocorasick  # optional: one-pass DROP_TOKENS lookup
+except ImportError:
+    ahocorasick = None
+
+from leg5_src.prefilter import build_prefilter, candidate_patterns
+
+logger = logging.getLogger("leg_parser")
+
 INCLUDE_SENSITIVE_IDS = False
 
 RE_CUI = re.compile(r'\b(?:CUI|Cod(?:ul)?\s+unic(?:\s+de)?\s+înregistrare)\s*[:\-]?\s*(?:RO\s*)?(\d{3,10})\b', re.I)
@@ -20,11 +29,14 @@ RE_ADDRESS = re.compile(
 RE_COUNTY = re.compile(r'\bjud\.\s*([A-ZĂÂÎȘȚ][A-Za-zĂÂÎȘȚăâîșț \-]+)', re.I)
 RE_CITY = re.compile(r'\b(?:municipiul|ora[șs]ul|mun\.)\s*([A-ZĂÂÎȘȚ][A-Za-zĂÂÎȘȚăâîșț \-]+)', re.I)
 RE_NAME_LINE = re.compile(r'^\s*-\s*denumire\s+și\s+form[ăa]\s+juridic[ăa]\s*[:\-]?\s*(.+?)\s*;?\s*$', re.I | re.M)
+RE_LEGAL_SUFFIX = re.compile(r'\b(S\.?\s*R\.?\s*L\.?|S\.?\s*A\.?|P\.?\s*F\.?\s*A\.?)\b')
 RE_NAME_STRONG = re.compile(r'^\s*([A-Z0-9 \-\.„”"\'&]+(?:S\.?R\.?L\.?|S\.?A\.?|P\.?F\.?A\.?))\s*$', re.M)
 
 RE_ADMIN_BLOCK = re.compile(r'\badministrator[i]?\s*[:\-]\s*(?:\d+\.\s*)?(.+?)(?:;|\.?\s*$|\n-|\n\d+\.)', re.I | re.S)
 RE_FOUNDER_BLOCK = re.compile(r'\bfondator[i]?\s*[:\-]\s*(?:\d+\.\s*)?(.+?)(?:;|\.?\s*$|\n-|\n\d+\.)', re.I | re.S)
 RE_SPLIT_NAMES = re.compile(r'\s*,\s*|\s*;\s*|\s+\bși\b\s+|\s+si\s+', re.I)
+# the "și"/"si" alternatives of RE_SPLIT_NAMES on their own
+RE_SPLIT_CONJ = re.compile(r'\s+\bși\b\s+|\s+si\s+', re.I)
 RE_PERSON_LIKE = re.compile(
     r'^\s*(?:\d+\.\s*)?([A-ZĂÂÎȘȚ][A-Za-zĂÂÎȘȚăâîșț\'\-]+(?:\s+[A-ZĂÂÎȘȚ][A-Za-zĂÂÎȘȚăâîșț\'\-]+)+)\s*$')
 
@@ -33,20 +45,52 @@ DROP_TOKENS = {
     "cu domiciliul în", "domiciliul în", "domiciliat în", "sectorul", "strada", "str.", "scara", "etaj", "ap."
 }
 
+# Only [ \t] runs that _clean actually changes: 2+ chars or a lone tab. A plain
+# "[ \t]+" also matches (and rebuilds) every single space between words.
+RE_HSPACE_RUN = re.compile(r'(?: [ \t]|\t)[ \t]*')
+RE_BLANK_LINES = re.compile(r'\n{2,}')
+
 RE_DATE_OF_CREATION = re.compile(r'înmatriculat[ăa]\s*(?:la|în)\s*data\s+de\s+(\d{2}\.\d{2}\.\d{4})', re.I)
 RE_EXTRAS_NO_DATE = re.compile(r'EXTRAS\s+AL\s+ÎNCHEIERII\s+NR\.\s*([0-9]+)\/(\d{2}\.\d{2}\.\d{4})', re.I)
 
+# Patterns searched over the whole document; a Hyperscan prefilter over these
+# tells which of them can match at all (RE_COUNTY/RE_CITY only see the address).
+# They stay separate re searches: fused into one named-group alternation their
+# matches overlap (the "sediul social ..." span runs over the CUI, capital and
+# admin/founder blocks; a J.. number swallows a CAEN-looking year) and hide each
+# other, and finditer cannot stop at the first hit per field (measured ~1.8x
+# slower than separate searches).
+PREFILTER_PATTERNS = (
+    RE_CUI, RE_EUID, RE_REG, RE_CAEN, RE_CAEN_GROUP, RE_CAPITAL, RE_ADDRESS,
+    RE_NAME_LINE, RE_NAME_STRONG, RE_ADMIN_BLOCK, RE_FOUNDER_BLOCK,
+    RE_DATE_OF_CREATION, RE_EXTRAS_NO_DATE,
+)
+
+
+FIELD_PREFILTER = build_prefilter(PREFILTER_PATTERNS, logger)
+
+
+def _candidate_patterns(text: str):
+    """PREFILTER_PATTERNS that may match text, or None (= all) without hyperscan."""
+    return candidate_patterns(FIELD_PREFILTER, PREFILTER_PATTERNS, text, logger)
+
+
+def _search(rx: re.Pattern, text: str, candidates=None):
+    if candidates is not None and rx not in candidates:
+        return None
+    return rx.search(text)
+
 
 def _clean(s: str) -> str:
     s = s.replace('\xa0', ' ')
-    s = re.sub(r'[ \t]+', ' ', s)
-    s = re.sub(r'\n{2,}', '\n', s)
+    s = RE_HSPACE_RUN.sub(' ', s)
+    s = RE_BLANK_LINES.sub('\n', s)
     return s.strip()
 
 
-def _parse_addresses(text: str) -> List[Dict[str, str]]:
+def _parse_addresses(text: str, candidates=None) -> List[Dict[str, str]]:
     out: List[Dict[str, str]] = []
-    m = RE_ADDRESS.search(text)
+    m = _search(RE_ADDRESS, text, candidates)
     if m:
         full = m.group(1).strip().rstrip('.').rstrip(',')
         county = None
@@ -64,20 +108,34 @@ def _parse_addresses(text: str) -> List[Dict[str, str]]:
     return out
 
 
-def _find_company_name(text: str) -> Optional[str]:
-    m = RE_NAME_LINE.search(text)
-    if m:
-        return m.group(1).strip()
-    m2 = RE_NAME_STRONG.search(text)
-    if m2:
-        return m2.group(1).strip()
+def _first_suffix_line(text: str) -> Optional[str]:
     for line in text.splitlines():
         L = line.strip()
-        if re.search(r'\b(S\.?\s*R\.?\s*L\.?|S\.?\s*A\.?|P\.?\s*F\.?\s*A\.?)\b', L):
+        if RE_LEGAL_SUFFIX.search(L):
             return L
     return None
 
 
+def _find_company_name(text: str, candidates=None) -> Optional[str]:
+    m = _search(RE_NAME_LINE, text, candidates)
+    if m:
+        return m.group(1).strip()
+    m2 = _search(RE_NAME_STRONG, text, candidates)
+    if m2:
+        return m2.group(1).strip()
+    # A line can only match where the whole text does: no hit means no line,
+    # lines before the first hit are skipped, and the rest of the text is only
+    # split into lines if the line(s) around that hit do not match on their own.
+    m3 = RE_LEGAL_SUFFIX.search(text)
+    if not m3:
+        return None
+    start = text.rfind('\n', 0, m3.start()) + 1
+    end = text.find('\n', m3.end())
+    if end == -1:
+        end = len(text)
+    return _first_suffix_line(text[start:end]) or _first_suffix_line(text[end + 1:])
+
+
 def _legal_form_from_name(name: Optional[str]) -> Optional[str]:
     if not name: return None
     t = name.upper()
@@ -87,34 +145,59 @@ def _legal_form_from_name(name: Optional[str]) -> Optional[str]:
     return None
 
 
+def _build_drop_automaton():
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for tok in DROP_TOKENS:
+        automaton.add_word(tok, tok)
+    automaton.make_automaton()
+    return automaton
+
+
+DROP_AUTOMATON = _build_drop_automaton()
+
+
+def _has_drop_token(low: str) -> bool:
+    """any(tok in low for tok in DROP_TOKENS), in one Aho-Corasick pass when available."""
+    if DROP_AUTOMATON is None:
+        return any(tok in low for tok in DROP_TOKENS)
+    return next(DROP_AUTOMATON.iter(low), None) is not None
+
+
 def _split_people(raw: str) -> List[str]:
-    parts = RE_SPLIT_NAMES.split(raw)
-    cleaned = []
+    # Comma-only lists (the common case) split in C; parts are stripped below,
+    # so the whitespace RE_SPLIT_NAMES would eat around each comma makes no difference.
+    if ';' not in raw and not RE_SPLIT_CONJ.search(raw):
+        parts = raw.split(',')
+    else:
+        parts = RE_SPLIT_NAMES.split(raw)
+    seen = set()
+    out = []
     for p in parts:
         p = p.strip().strip(';.,')
         if not p:
             continue
         low = p.lower()
-        if any(tok in low for tok in DROP_TOKENS):
+        if _has_drop_token(low):
             continue
         m = RE_PERSON_LIKE.match(p)
-        if m:
-            name = m.group(1)
-            name = re.sub(r'^\d+\.\s*', '', name).strip()
-            cleaned.append(name)
-    seen = set();
-    out = []
-    for n in cleaned:
-        key = n.lower()
-        if key in seen: continue
-        seen.add(key);
-        out.append(n)
+        if not m:
+            continue
+        # group 1 starts with a capital letter and ends on a name character,
+        # so there is no "N." prefix or padding left to trim
+        name = m.group(1)
+        key = name.lower()
+        if key in seen:
+            continue
+        seen.add(key)
+        out.append(name)
     return out
 
 
-def _extract_people_block(text: str, kind: str) -> List[Dict[str, Any]]:
+def _extract_people_block(text: str, kind: str, candidates=None) -> List[Dict[str, Any]]:
     rx = RE_ADMIN_BLOCK if kind == "admin" else RE_FOUNDER_BLOCK
-    m = rx.search(text)
+    m = _search(rx, text, candidates)
     if not m:
         return []
     raw = m.group(1)
@@ -131,34 +214,38 @@ def _norm_date(d: str) -> Optional[str]:
 
 def extract_structured_company(raw_text: str, data_source: Optional[str] = None) -> Dict[str, Any]:
     text = _clean(raw_text)
-    name = _find_company_name(text)
+    candidates = _candidate_patterns(text)
+    name = _find_company_name(text, candidates)
 
-    cui = (RE_CUI.search(text).group(1) if RE_CUI.search(text) else None)
-    euid = (RE_EUID.search(text).group(1) if RE_EUID.search(text) else None)
-    regno = (RE_REG.search(text).group(1) if RE_REG.search(text) else None)
+    m = _search(RE_CUI, text, candidates)
+    cui = m.group(1) if m else None
+    m = _search(RE_EUID, text, candidates)
+    euid = m.group(1) if m else None
+    m = _search(RE_REG, text, candidates)
+    regno = m.group(1) if m else None
 
     caen_code = None
     caen_desc = None
-    ma = RE_CAEN.search(text)
+    ma = _search(RE_CAEN, text, candidates)
     if ma:
         caen_code, caen_desc = ma.group(1), ma.group(2).strip()
     else:
-        mg = RE_CAEN_GROUP.search(text)
+        mg = _search(RE_CAEN_GROUP, text, candidates)
         if mg: caen_code = mg.group(1)
 
-    capital = (RE_CAPITAL.search(text).group(1).replace(' ', '') + " lei capital social"
-               if RE_CAPITAL.search(text) else None)
-    addresses = _parse_addresses(text)
+    mcap = _search(RE_CAPITAL, text, candidates)
+    capital = (mcap.group(1).replace(' ', '') + " lei capital social") if mcap else None
+    addresses = _parse_addresses(text, candidates)
 
-    admins = _extract_people_block(text, "admin")
-    founders = _extract_people_block(text, "founder")
+    admins = _extract_people_block(text, "admin", candidates)
+    founders = _extract_people_block(text, "founder", candidates)
 
     created = None
-    mdate = RE_DATE_OF_CREATION.search(text)
+    mdate = _search(RE_DATE_OF_CREATION, text, candidates)
     if mdate:
         created = _norm_date(mdate.group(1))
     else:
-        mex = RE_EXTRAS_NO_DATE.search(text)
+        mex = _search(RE_EXTRAS_NO_DATE, text, candidates)
         if mex: created = _norm_date(mex.group(2))
 
     legal_form = _legal_form_from_name(name) or None
@@ -0,0 +1,62 @@
+# Hyperscan prefilter shared by the leg5 extractor and parser.
+from __future__ import annotations
+import logging
+import re
+from typing import Optional, Sequence, Set
+
+try:
+    import hyperscan  # optional: prefilter for the field regexes
+except ImportError:
+    hyperscan = None
+
+# Hyperscan (UCP, caseless) is at least as wide as re only on the blocks kept out
+# of this class, checked codepoint by codepoint against every class and literal
+# the field patterns use. Elsewhere the two disagree: re's \s also takes \x1c-\x1f, re.I folds İ/ı
+# onto i, and Hyperscan's Unicode tables lag Python's for \w/\d in newer scripts.
+# Text with anything else is searched with every pattern.
+RE_PREFILTER_UNSAFE = re.compile(r'[^\x00-\x1b\x20-\u012f\u0132-\u052f\u1e00-\u214f]')
+
+
+def build_prefilter(patterns: Sequence[re.Pattern], logger: logging.Logger):
+    """
+    Compile patterns into one Hyperscan database in prefilter mode: a single
+    DFA pass tells which patterns can possibly match (caseless/dotall/multiline
+    widen it, never narrow), so re only runs for those. Returns None without
+    hyperscan or if compilation fails.
+    """
+    if hyperscan is None:
+        return None
+    flags = (hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_DOTALL | hyperscan.HS_FLAG_MULTILINE
+             | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP
+             | hyperscan.HS_FLAG_PREFILTER | hyperscan.HS_FLAG_SINGLEMATCH)
+    try:
+        db = hyperscan.Database()
+        db.compile(
+            expressions=[rx.pattern.encode("utf-8") for rx in patterns],
+            ids=list(range(len(patterns))),
+            elements=len(patterns),
+            flags=[flags] * len(patterns),
+        )
+        return db
+    except Exception as e:
+        logger.warning(f"hyperscan prefilter disabled: {e}")
+        return None
+
+
+def candidate_patterns(db, patterns: Sequence[re.Pattern], text: str,
+                       logger: logging.Logger) -> Optional[Set[re.Pattern]]:
+    """
+    patterns that may match text, or None (= all) without a prefilter database
+    or when text has characters the prefilter could miss matches on.
+    """
+    if db is None or RE_PREFILTER_UNSAFE.search(text):
+        return None
+    found = set()
+    try:
+        db.scan(text.encode("utf-8"), match_event_handler=lambda i, *_: found.add(patterns[i]))
+    except Exception as e:
+        # e.g. lone surrogates (not UTF-8 encodable): the prefilter is only an
+        # optimization, so fall back to searching every pattern
+        logger.debug(f"hyperscan prefilter skipped: {e}")
+        return None
+    return found
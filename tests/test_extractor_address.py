@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+"""Pin the address regexes that share UNTIL_STOP in the leg5 extractor."""
+import logging
+import unittest
+
+# the extractor calls logging.basicConfig(filename=...) at import; a root handler
+# makes that a no-op so running the tests does not drop a log file in the cwd
+logging.getLogger().addHandler(logging.NullHandler())
+
+from leg5_src.extractor.extractor import RE_ADDRESS_FALLBACK, RE_SEDIU_COLON, RE_SEDIU_IN  # noqa: E402
+
+
+def _address(rx, text):
+    m = rx.search(text)
+    return m.group(m.lastindex) if m else None
+
+
+class AddressPatternTest(unittest.TestCase):
+    def test_trailing_comma_before_stop_word(self):
+        text = "cu sediul social în București, str. Lalelelor nr. 1, înregistrată la ORC"
+        self.assertEqual(_address(RE_SEDIU_IN, text), "București, str. Lalelelor nr. 1")
+
+    def test_whitespace_before_stop_word(self):
+        text = "Sediul: Cluj-Napoca, str. Zorilor nr. 5   având CUI 123"
+        self.assertEqual(_address(RE_SEDIU_COLON, text), "Cluj-Napoca, str. Zorilor nr. 5")
+
+    def test_fallback_stops_at_stop_word(self):
+        text = "domiciliat în municipiul Timișoara, str. Florilor, CUI 123"
+        self.assertEqual(_address(RE_ADDRESS_FALLBACK, text), "Timișoara, str. Florilor")
+
+    def test_end_of_text(self):
+        self.assertEqual(_address(RE_SEDIU_COLON, "sediul social: Iași, bd. Independenței nr. 3"),
+                         "Iași, bd. Independenței nr. 3")
+        self.assertEqual(_address(RE_SEDIU_COLON, "sediul social: Arad, str. Mică nr. 2\n"),
+                         "Arad, str. Mică nr. 2")
+
+    def test_no_stop_word(self):
+        self.assertIsNone(_address(RE_SEDIU_COLON, "sediul: Brașov; alte date despre firmă"))
+        self.assertIsNone(_address(RE_ADDRESS_FALLBACK, "în satul Valea Mare, comuna X; înregistrată"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+"""Pin the print_r parsing helpers of the iLegis driver."""
+import unittest
+
+from ilegis_to_json_parser import (
+    _extract_articles_from_print_r, _extract_block, _parse_articole_item, _split_articole,
+    _to_list_if_numeric, parse_php_array,
+)
+
+MODAL = """Array
+(
+    [numar] => 13
+    [an] => 2023
+    [articole] => Array
+        (
+            [0] => Array
+                (
+                    [id] => 5
+                    [numesocietate] => ACME SRL
+                    [cif] => Array
+                        (
+                            [0] => 123
+                        )
+
+                    [titlu] => T
+                )
+
+            [1] => Array
+                (
+                    [id] => 6
+                )
+
+        )
+
+)
+"""
+
+ITEM = """            [id] => Array
+            [numesocietate] => ACME SRL
+            [regcom] => Array
+                (
+                    [0] => J40/1/2020
+                )
+
+            [buletinid] => 9
+            [articol] => line one
+  line two
+            [titlu] => T
+"""
+
+
+class ParsePhpArrayTest(unittest.TestCase):
+    def test_nested_arrays(self):
+        self.assertEqual(parse_php_array(MODAL), {
+            "numar": "13",
+            "an": "2023",
+            "articole": [
+                {"id": "5", "numesocietate": "ACME SRL", "cif": ["123"], "titlu": "T"},
+                {"id": "6"},
+            ],
+        })
+
+    def test_unterminated_arrays_keep_what_was_read(self):
+        text = "Array\n(\n    [a] => 1\n    [b] => Array\n        (\n            [c] => 2\n"
+        self.assertEqual(parse_php_array(text), {"a": "1", "b": {"c": "2"}})
+
+    def test_value_on_next_line_and_multiline_value(self):
+        text = "Array\n(\n    [titlu] =>\nRectificare\n    [x] => multi\n      line\n)\n"
+        self.assertEqual(parse_php_array(text), {"titlu": "Rectificare", "x": "multi\n      line"})
+
+    def test_entities_are_decoded(self):
+        self.assertEqual(parse_php_array("Array\n(\n    [t] =&gt; x &amp; y\n)\n"), {"t": "x & y"})
+
+    def test_empty(self):
+        self.assertEqual(parse_php_array(""), {})
+
+
+class ToListIfNumericTest(unittest.TestCase):
+    def test_dense_keys_become_lists(self):
+        self.assertEqual(_to_list_if_numeric({"0": "a", "1": {"1": "x", "0": "y"}}), ["a", ["y", "x"]])
+
+    def test_zero_padded_keys(self):
+        # "01" counts as index 1 while the indices are dense...
+        self.assertEqual(_to_list_if_numeric({"01": "a", "0": "b"}), ["b", "a"])
+        # ...but "01" and "1" collide, so that dict is kept
+        self.assertEqual(_to_list_if_numeric({"01": "a", "1": "b"}), {"01": "a", "1": "b"})
+
+    def test_sparse_or_non_digit_keys_stay_dicts(self):
+        self.assertEqual(_to_list_if_numeric({"0": "a", "2": "b"}), {"0": "a", "2": "b"})
+        self.assertEqual(_to_list_if_numeric({"0": "a", "x": "b"}), {"0": "a", "x": "b"})
+        self.assertEqual(_to_list_if_numeric({}), {})
+
+
+class ArticoleTest(unittest.TestCase):
+    def test_split_articole(self):
+        items = _split_articole(MODAL)
+        self.assertEqual(len(items), 2)
+        self.assertEqual(items[1], "                    [id] => 6")
+        self.assertIn("[0] => 123", items[0])
+
+    def test_split_articole_without_items(self):
+        self.assertIsNone(_split_articole("no articole here"))
+        self.assertIsNone(_split_articole("Array\n(\n    [articole] => Array\n        (\n        )\n\n)\n"))
+
+    def test_split_articole_unterminated(self):
+        raw = "[articole] => Array\n(\n  [0] => Array\n  (\n   [id] => 1\n   [titlu] => x\n"
+        self.assertEqual(_split_articole(raw), [""])
+
+    def test_parse_item(self):
+        item = _parse_articole_item(ITEM)
+        self.assertTrue(item.pop("print_r_item").startswith("          [id] => Array\n"))
+        self.assertEqual(item, {
+            "id": "Array",  # "[id] => Array" yields "Array", as the old per-key searches did
+            "company": "ACME SRL",
+            "title": "T",
+            "regcom": "J40/1/2020",
+            "cif": "",
+            "buletinid": "9",
+            "articol_text": "line one\n  line two",
+        })
+
+    def test_articles_from_print_r(self):
+        arts = _extract_articles_from_print_r(MODAL)
+        self.assertEqual([(a["id"], a["company"], a["title"], a["cif"]) for a in arts],
+                         [("5", "ACME SRL", "T", "123"), ("6", "", "", "")])
+
+    def test_extract_block(self):
+        self.assertEqual(_extract_block("[id] => 1\n[articol] => a\n  b\n[titlu] => c", "articol"), "a\n  b")
+        self.assertEqual(_extract_block("[articol] => a &amp; b", "articol"), "a & b")
+        self.assertIsNone(_extract_block("[id] => 1", "articol"))
+
+
+if __name__ == "__main__":
+    unittest.main()
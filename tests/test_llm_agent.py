@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""Pin how llm_agent drives pydantic_ai's Agent, with a fake in place of the library."""
+import asyncio
+import types
+import unittest
+from unittest import mock
+
+from leg5_src.parser import llm_agent
+from leg5_src.parser.models import CompanyModel
+
+FIELDS = {"id": "c1", "type": "company", "name": "ALFA SRL"}
+COMPANY = dict(FIELDS, mainInfo=None)
+
+
+class FakeAgent:
+    """Accepts only the pydantic-ai 1.x keywords llm_agent is written against."""
+    instances = []
+
+    def __init__(self, model, *, system_prompt=(), output_type=str):
+        self.kwargs = {"model": model, "system_prompt": system_prompt, "output_type": output_type}
+        self.prompts = []
+        FakeAgent.instances.append(self)
+
+    def _result(self, prompt):
+        self.prompts.append(prompt)
+        return types.SimpleNamespace(output=self.kwargs["output_type"](**FIELDS))
+
+    def run_sync(self, prompt):
+        return self._result(prompt)
+
+    async def run(self, prompt):
+        await asyncio.sleep(0)
+        return self._result(prompt)
+
+
+class LlmAgentTest(unittest.TestCase):
+    def setUp(self):
+        FakeAgent.instances = []
+        fake = types.ModuleType("pydantic_ai")
+        fake.Agent = FakeAgent
+        for patcher in (mock.patch.dict("sys.modules", {"pydantic_ai": fake}),
+                        mock.patch.object(llm_agent, "_CACHE_DB", False)):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        llm_agent._agent.cache_clear()
+        self.addCleanup(llm_agent._agent.cache_clear)
+
+    def test_agent_kwargs(self):
+        llm_agent.run_llm("notice", model_name="openai:gpt-4o-mini")
+        (agent,) = FakeAgent.instances
+        self.assertEqual(agent.kwargs, {"model": "openai:gpt-4o-mini",
+                                        "system_prompt": llm_agent.RULES,
+                                        "output_type": CompanyModel})
+        self.assertEqual(agent.prompts, ["notice"])
+
+    def test_run_llm_returns_dict(self):
+        self.assertEqual(llm_agent.run_llm("notice", model_name="m"), COMPANY)
+
+    def test_run_llm_batch_keeps_order_and_reuses_agent(self):
+        out = llm_agent.run_llm_batch(["a", "b", "c"], model_name="m")
+        self.assertEqual(out, [COMPANY] * 3)
+        (agent,) = FakeAgent.instances
+        self.assertEqual(sorted(agent.prompts), ["a", "b", "c"])
+
+
+if __name__ == "__main__":
+    unittest.main()
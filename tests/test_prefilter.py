@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""The Hyperscan prefilter must never change what the field regexes find."""
+import logging
+import unittest
+from unittest import mock
+
+# the extractor calls logging.basicConfig(filename=...) at import; a root handler
+# makes that a no-op so running the tests does not drop a log file in the cwd
+logging.getLogger().addHandler(logging.NullHandler())
+
+from leg5_src.extractor import extractor  # noqa: E402
+from leg5_src.parser import parser  # noqa: E402
+
+# characters where re and Hyperscan disagree (\s, case folding, newer Unicode)
+ODD_CHARS = ("\x1c", "\x1d", "\x1e", "\x1f", "İ", "ı", "\u017f", "\u212a", "\u180e", "\U00011450")
+
+NOTICES = (
+    "SC Alfa Construct SRL, cu sediul social în București, str. Lalelelor nr. 1, "
+    "înregistrată la ORC sub nr. J40/123/2020, CUI 12345678, EUID ROONRC.J40/123/2020, "
+    "capital social: 200 lei, cod CAEN 4120 - Lucrări de construcții.",
+    "Sediul: Cluj-Napoca, str. Zorilor nr. 5 având CUI 87654321. "
+    "Administrator: Ion Pop; Maria Pop. Fondator: Ion Pop; "
+    "înmatriculată la data de 01.02.2020",
+)
+
+
+def _extract(text):
+    return extractor._extract_entry(text, None, (None, None, None)).model_dump()
+
+
+def _parse(text):
+    with mock.patch.object(parser.uuid, "uuid4", return_value="id"):
+        return parser.extract_structured_company(text)
+
+
+def _variants():
+    """The notices with each odd character spliced in for spaces and letters."""
+    for text in NOTICES:
+        for ch in ODD_CHARS:
+            yield text.replace(" ", ch, 3)
+            yield text.replace(" ", ch)
+            yield text.replace("i", ch).replace("I", ch)
+
+
+class PrefilterEquivalenceTest(unittest.TestCase):
+    def _assert_same(self, module, run, texts):
+        for text in texts:
+            with self.subTest(text=text):
+                with_prefilter = run(text)
+                with mock.patch.object(module, "FIELD_PREFILTER", None):
+                    self.assertEqual(with_prefilter, run(text))
+
+    def test_extractor_pinned_inputs(self):
+        meta = _extract("CUI\x1c12345678")["meta"]
+        self.assertEqual(meta["cui"], "12345678")
+        self.assertEqual(_extract("CUİ 12345678")["meta"]["cui"], "12345678")
+        self.assertEqual(_extract("J\x1e40/123/2020")["meta"]["reg_number"], "J\x1e40/123/2020")
+        self.assertEqual(_extract("capital\x1csocial: 5 lei")["meta"]["capital"], "5 lei")
+        self.assertEqual(_extract("cu\x1csediul social în București, având")["meta"]["address"],
+                         "București")
+
+    def test_parser_pinned_inputs(self):
+        self.assertEqual(_parse("CUI\x1c12345678")["mainInfo"]["cui"], "RO12345678")
+        self.assertEqual(_parse("capital social\x1d: 200 lei")["mainInfo"]["capital"],
+                         "200 lei capital social")
+        associates = _parse("fondator\x1c: Ion Pop;")["mainInfo"]["ownership"][0]["associates"]
+        self.assertTrue(associates)
+
+    def test_extractor_same_with_and_without_prefilter(self):
+        texts = ("CUI\x1c12345678", "J\x1e40/123/2020", "capital\x1csocial: 5 lei",
+                 "cu\x1csediul social în București, având", "CUİ 12345678") + NOTICES
+        self._assert_same(extractor, _extract, texts + tuple(_variants()))
+
+    def test_parser_same_with_and_without_prefilter(self):
+        texts = ("CUI\x1c12345678", "capital social\x1d: 200 lei", "fondator\x1c: Ion Pop;") + NOTICES
+        self._assert_same(parser, _parse, texts + tuple(_variants()))
+
+
+if __name__ == "__main__":
+    unittest.main()